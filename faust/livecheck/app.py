@@ -1,26 +1,28 @@
 """LiveCheck - Faust Application."""
 import asyncio
+from collections import defaultdict
 from datetime import timedelta
+from functools import cached_property as _fcached_property, lru_cache
 from typing import (
     Any,
     Callable,
     ClassVar,
     Dict,
-    Iterable,
     List,
     Optional,
+    Sequence,
     Tuple,
     Type,
     cast,
 )
 
 from mode.signals import BaseSignalT
-from mode.utils.compat import want_bytes
 from mode.utils.objects import annotations, cached_property, qualname
 from mode.utils.times import Seconds
 
 import faust
 from faust.app.base import SCAN_CATEGORIES
+from faust.exceptions import ImproperlyConfigured
 from faust.sensors.base import Sensor
 from faust.types import TP, AgentT, AppT, EventT, StreamT, TopicT
 from faust.utils import venusian
@@ -43,23 +45,33 @@ _Case = Case
 patches.patch_all()  # XXX
 
 
+@lru_cache(maxsize=256)
+def _prepare_case_name_cached(name: str, origin: Optional[str]) -> str:
+    if name.startswith("__main__."):
+        if not origin:
+            raise RuntimeError("LiveCheck app missing origin argument")
+        return origin + name[8:]
+    return name
+
+
 class LiveCheckSensor(Sensor):
     def on_stream_event_in(
         self, tp: TP, offset: int, stream: StreamT, event: EventT
     ) -> Optional[Dict]:
         """Call when stream starts processing event."""
-        test = TestExecution.from_headers(event.headers)
-        if test is not None:
-            stream.current_test = test  # type: ignore
-            current_test_stack.push_without_automatic_cleanup(test)
+        headers = event.headers
+        if headers:
+            test = TestExecution.from_headers(headers)
+            if test is not None:
+                stream.current_test = test  # type: ignore
+                current_test_stack.push_without_automatic_cleanup(test)
         return None
 
     def on_stream_event_out(
         self, tp: TP, offset: int, stream: StreamT, event: EventT, state: Dict = None
     ) -> None:
         """Call when stream is finished handling event."""
-        has_active_test = getattr(stream, "current_test", None)
-        if has_active_test:
+        if getattr(stream, "current_test", None) is not None:
             stream.current_test = None  # type: ignore
             current_test_stack.pop()
 
@@ -78,7 +90,17 @@ class LiveCheck(faust.App):
     #: Number of concurrent actors processing signal events.
     bus_concurrency: int = 30
 
-    #: Number of concurrent actors executing test cases.
+    #: Max number of signal events to buffer before resolving them.
+    bus_batch_size: int = 500
+
+    #: Max time to wait for the signal event buffer to fill up.
+    bus_batch_within: Seconds = timedelta(seconds=1)
+
+    #: Number of concurrent workers executing test cases (must be >= 1).
+    #: Pending tests are buffered in a queue of twice this size.
+    #: Tests are acked when queued, so queued and running tests are lost
+    #: if the app stops or crashes, and tests from partitions revoked
+    #: in a rebalance still run on this worker.
     test_concurrency: int = 100
 
     #: Unset this if you don't want reports to be sent to
@@ -93,6 +115,11 @@ class LiveCheck(faust.App):
 
     _resolved_signals: Dict[Tuple[str, str, Any], SignalEvent]
 
+    _test_queue: "asyncio.Queue[Tuple[str, TestExecution]]"
+
+    _bus_agent: Optional[AgentT]
+    _test_execution_agent: Optional[AgentT]
+
     @classmethod
     def for_app(
         cls,
@@ -104,6 +131,8 @@ class LiveCheck(faust.App):
         bus_topic_name: Optional[str] = None,
         report_topic_name: Optional[str] = None,
         bus_concurrency: Optional[int] = None,
+        bus_batch_size: Optional[int] = None,
+        bus_batch_within: Optional[Seconds] = None,
         test_concurrency: Optional[int] = None,
         send_reports: Optional[bool] = None,
         **kwargs: Any,
@@ -114,17 +143,24 @@ class LiveCheck(faust.App):
         """
         app_id, passed_kwargs = app._default_options
         livecheck_id = f"{prefix}{app_id}"
-        override = {
-            "web_port": web_port,
-            "test_topic_name": test_topic_name,
-            "bus_topic_name": bus_topic_name,
-            "report_topic_name": report_topic_name,
-            "bus_concurrency": bus_concurrency,
-            "test_concurrency": test_concurrency,
-            "send_reports": send_reports,
-            **kwargs,
-        }
-        options = {**passed_kwargs, **override}
+        options = dict(passed_kwargs)
+        # unset arguments must not replace options passed to the target app.
+        options.update(
+            (key, value)
+            for key, value in (
+                ("web_port", web_port),
+                ("test_topic_name", test_topic_name),
+                ("bus_topic_name", bus_topic_name),
+                ("report_topic_name", report_topic_name),
+                ("bus_concurrency", bus_concurrency),
+                ("bus_batch_size", bus_batch_size),
+                ("bus_batch_within", bus_batch_within),
+                ("test_concurrency", test_concurrency),
+                ("send_reports", send_reports),
+            )
+            if value is not None
+        )
+        options.update(kwargs)
 
         livecheck_app = cls(livecheck_id, **options)
         livecheck_app._contribute_to_app(app)
@@ -132,10 +168,11 @@ class LiveCheck(faust.App):
         return livecheck_app
 
     def _contribute_to_app(self, app: AppT) -> None:
-        from .patches.aiohttp import LiveCheckMiddleware
+        from .patches.aiohttp import livecheck_middleware
 
         web_app = app.web.web_app  # type: ignore
-        web_app.middlewares.append(LiveCheckMiddleware())
+        web_app.middlewares.append(livecheck_middleware)
+        # the sensor is not shared: sensors are services bound to one app.
         app.sensors.add(LiveCheckSensor())
         app.livecheck = self  # type: ignore
 
@@ -147,6 +184,8 @@ class LiveCheck(faust.App):
         bus_topic_name: Optional[str] = None,
         report_topic_name: Optional[str] = None,
         bus_concurrency: Optional[int] = None,
+        bus_batch_size: Optional[int] = None,
+        bus_batch_within: Optional[Seconds] = None,
         test_concurrency: Optional[int] = None,
         send_reports: Optional[bool] = None,
         **kwargs: Any,
@@ -161,14 +200,24 @@ class LiveCheck(faust.App):
             self.report_topic_name = report_topic_name
         if bus_concurrency is not None:
             self.bus_concurrency = bus_concurrency
+        if bus_batch_size is not None:
+            self.bus_batch_size = bus_batch_size
+        if bus_batch_within is not None:
+            self.bus_batch_within = bus_batch_within
         if test_concurrency is not None:
             self.test_concurrency = test_concurrency
+        if self.test_concurrency < 1:
+            raise ImproperlyConfigured(
+                f"LiveCheck test_concurrency must be at least 1, "
+                f"not {self.test_concurrency!r}"
+            )
         if send_reports is not None:
             self.send_reports = send_reports
 
         self.cases = {}
         self._resolved_signals = {}
-        patches.patch_all()
+        self._bus_agent = None
+        self._test_execution_agent = None
         self._apply_monkeypatches()
         self._connect_signals()
 
@@ -185,8 +234,15 @@ class LiveCheck(faust.App):
         patches.patch_all()
 
     def _connect_signals(self) -> None:
+        # Weak references to the same method compare equal, so connecting
+        # more than once is a no-op and the handler can be disconnected.
         AppT.on_produce_message.connect(
-            self.on_produce_attach_test_headers
+            self.on_produce_attach_test_headers, weak=True
+        )  # type: ignore
+
+    def _disconnect_signals(self) -> None:
+        AppT.on_produce_message.disconnect(
+            self.on_produce_attach_test_headers, weak=True
         )  # type: ignore
 
     def on_produce_attach_test_headers(
@@ -205,7 +261,7 @@ class LiveCheck(faust.App):
         if test is not None:
             if headers is None:
                 raise TypeError("Produce request missing headers list")
-            headers.extend([(k, want_bytes(v)) for k, v in test.as_headers().items()])
+            headers.extend(test.as_header_bytes)
 
     def case(
         self,
@@ -243,17 +299,17 @@ class LiveCheck(faust.App):
                 },
             )
 
-            signal_types = dict(self._extract_signals(case_cls, base_case))
+            signal_types = self._extract_signals(case_cls, base_case)
             signals = []
 
-            for i, (attr_name, attr_type) in enumerate(signal_types.items()):
+            for i, (attr_name, attr_type) in enumerate(signal_types, start=1):
                 signal = getattr(case_cls, attr_name, None)
                 if signal is None:
-                    signal = attr_type(name=attr_name, index=i + 1)
+                    signal = attr_type(name=attr_name, index=i)
                     setattr(case_cls, attr_name, signal)
                     signals.append(signal)
                 else:
-                    signal.index = i + 1
+                    signal.index = i
 
             case = self.add_case(
                 case_cls(
@@ -282,7 +338,16 @@ class LiveCheck(faust.App):
 
     def _extract_signals(
         self, case_cls: Type[_Case], base_case: Type[_Case]
-    ) -> Iterable[Tuple[str, Type[BaseSignal]]]:
+    ) -> Sequence[Tuple[str, Type[BaseSignal]]]:
+        # case_cls is created by the case decorator every time, so cache
+        # on the decorated class (its first base) instead.  Read it from
+        # the class dict so that subclasses do not reuse the parent's
+        # signals.
+        owner = case_cls.__mro__[1]
+        cached = vars(owner).get("__livecheck_signals__")
+        if cached is not None and cached[0] is base_case:
+            return cached[1]
+
         fields, defaults = annotations(
             case_cls,
             stop=base_case,
@@ -290,15 +355,17 @@ class LiveCheck(faust.App):
             localns={case_cls.__name__: case_cls},
         )
 
+        signals: List[Tuple[str, Type[BaseSignal]]] = []
+        append = signals.append
         for attr_name, attr_type in fields.items():
             actual_type = getattr(attr_type, "__origin__", attr_type)
             if actual_type is None:  # Python <3.7
                 actual_type = attr_type
-            try:
-                if issubclass(actual_type, BaseSignal):
-                    yield attr_name, attr_type
-            except TypeError:  # pragma: no cover
-                pass  # pragma: no cover
+            if isinstance(actual_type, type) and issubclass(actual_type, BaseSignal):
+                append((attr_name, attr_type))
+        result = tuple(signals)
+        owner.__livecheck_signals__ = (base_case, result)  # type: ignore
+        return result
 
     def add_case(self, case: _Case) -> _Case:
         """Add and register new test case."""
@@ -315,8 +382,17 @@ class LiveCheck(faust.App):
     async def on_start(self) -> None:
         """Call when LiveCheck application starts."""
         await super().on_start()
-        self._install_bus_agent()
-        self._install_test_execution_agent()
+        self._connect_signals()
+        self._start_test_workers()
+        if self._bus_agent is None:
+            self._bus_agent = self._install_bus_agent()
+        if self._test_execution_agent is None:
+            self._test_execution_agent = self._install_test_execution_agent()
+
+    async def on_stop(self) -> None:
+        """Call when LiveCheck application stops."""
+        await super().on_stop()
+        self._disconnect_signals()
 
     async def on_started(self) -> None:
         """Call when LiveCheck application is fully started."""
@@ -333,49 +409,106 @@ class LiveCheck(faust.App):
     def _install_test_execution_agent(self) -> AgentT:
         return self.agent(
             channel=self.pending_tests,
-            concurrency=self.test_concurrency,
+            concurrency=1,
         )(self._execute_tests)
 
+    def _start_test_workers(self) -> None:
+        self._test_queue = asyncio.Queue(maxsize=self.test_concurrency * 2)
+        for _ in range(self.test_concurrency):
+            self.add_future(self._test_worker())
+
     async def _populate_signals(self, events: StreamT[SignalEvent]) -> None:
-        async for test_id, event in events.items():
-            event.case_name = self._prepare_case_name(event.case_name)
-            try:
-                case = self.cases[event.case_name]
-            except KeyError:
-                self.log.error(
-                    "Received signal %r for unregistered case %r",
-                    event,
-                    (test_id, event.case_name),
-                )
-            else:
-                await case.resolve_signal(test_id, event)
+        cases_get = self.cases.get
+        prepare = self._prepare_case_name
+        log_error = self.log.error
+        async for batch in events.take_events(
+            self.bus_batch_size, within=self.bus_batch_within
+        ):
+            by_case: Dict[str, List[Tuple[str, SignalEvent]]] = defaultdict(list)
+            for ev in batch:
+                test_id, event = ev.key, ev.value
+                case_name = event.case_name = prepare(event.case_name)
+                by_case[case_name].append((test_id, event))
+            for case_name, group in by_case.items():
+                case = cases_get(case_name)
+                if case is None:
+                    for test_id, event in group:
+                        log_error(
+                            "Received signal %r for unregistered case %r",
+                            event,
+                            (test_id, case_name),
+                        )
+                    continue
+                signals = case.signals
+                resolve_nowait = case.try_resolve_signal_nowait
+                pending = []
+                for test_id, event in group:
+                    if event.signal_name not in signals:
+                        log_error(
+                            "Received unknown signal %r for case %r",
+                            event,
+                            (test_id, case_name),
+                        )
+                    elif not resolve_nowait(test_id, event):
+                        pending.append((test_id, event))
+                if pending:
+                    results = await asyncio.gather(
+                        *(case.resolve_signal(tid, ev) for tid, ev in pending),
+                        return_exceptions=True,
+                    )
+                    for (test_id, event), result in zip(pending, results):
+                        if isinstance(result, BaseException):
+                            log_error(
+                                "Error resolving signal %r for test %r: %r",
+                                event,
+                                test_id,
+                                result,
+                                exc_info=result,
+                            )
 
     async def _execute_tests(self, tests: StreamT[TestExecution]) -> None:
+        # Tests are acked once queued, not when they finish executing:
+        # queued tests are lost on stop, and still run after a rebalance
+        # even if their partition was revoked.
+        queue_put = self._test_queue.put
         async for test_id, test in tests.items():
-            test.case_name = self._prepare_case_name(test.case_name)
+            await queue_put((test_id, test))
+
+    async def _test_worker(self) -> None:
+        queue = self._test_queue
+        queue_get, task_done = queue.get, queue.task_done
+        execute_test = self._execute_test
+        log_exception = self.log.exception
+        while not self.should_stop:
+            test_id, test = await queue_get()
             try:
-                case = self.cases[test.case_name]
-            except KeyError:
-                self.log.error(
-                    "Unregistered test case %r with id %r: %r",
-                    test.case_name,
-                    test_id,
-                    test,
-                )
-            else:
-                try:
-                    await case.execute(test)
-                except LiveCheckError:
-                    pass
+                await execute_test(test_id, test)
+            except Exception:
+                log_exception("Error executing test %r: %r", test_id, test)
+            finally:
+                task_done()
+
+    async def _execute_test(self, test_id: str, test: TestExecution) -> None:
+        case_name = test.case_name = self._prepare_case_name(test.case_name)
+        case = self.cases.get(case_name)
+        if case is None:
+            self.log.error(
+                "Unregistered test case %r with id %r: %r",
+                case_name,
+                test_id,
+                test,
+            )
+            return
+        try:
+            await case.execute(test)
+        except LiveCheckError:
+            pass
 
     def _prepare_case_name(self, name: str) -> str:
-        if name.startswith("__main__."):
-            if not self.conf.origin:
-                raise RuntimeError("LiveCheck app missing origin argument")
-            return self.conf.origin + name[8:]
-        return name
+        return _prepare_case_name_cached(name, self.conf.origin)
 
-    @cached_property
+    # functools.cached_property: a plain attribute once computed.
+    @_fcached_property
     def bus(self) -> TopicT:
         """Topic used for signal communication."""
         return self.topic(
@@ -384,7 +517,7 @@ class LiveCheck(faust.App):
             value_type=SignalEvent,
         )
 
-    @cached_property
+    @_fcached_property
     def pending_tests(self) -> TopicT:
         """Topic used to keep pending test executions."""
         return self.topic(
@@ -393,7 +526,7 @@ class LiveCheck(faust.App):
             value_type=TestExecution,
         )
 
-    @cached_property
+    @_fcached_property
     def reports(self) -> TopicT:
         """Topic used to log test reports."""
         return self.topic(
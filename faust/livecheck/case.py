@@ -236,6 +236,18 @@ class Case(Service):
         """Mark test execution signal as resolved."""
         await self.signals[event.signal_name].resolve(key, event)
 
+    def try_resolve_signal_nowait(self, key: str, event: SignalEvent) -> bool:
+        """Mark test execution signal as resolved, without waiting.
+
+        Returns :const:`False` if the signal could not be resolved
+        synchronously, in which case :meth:`resolve_signal` must be used.
+        """
+        signal = self.signals.get(event.signal_name)
+        if signal is None or type(signal).resolve is not BaseSignal.resolve:
+            return False
+        signal.resolve_nowait(key, event)
+        return True
+
     async def execute(self, test: TestExecution) -> None:
         """Execute test using :class:`TestRunner`."""
         t_start = monotonic()
@@ -1,5 +1,6 @@
 """Locals - Current test & execution context."""
 import typing
+from contextvars import ContextVar
 from typing import Optional
 
 from mode.locals import LocalStack
@@ -21,8 +22,47 @@ __all__ = [
     "current_test_stack",
 ]
 
-current_test_stack: LocalStack[TestExecution]
-current_test_stack = LocalStack()
+#: Topmost test of :data:`current_test_stack`, kept for fast lookups.
+_current_test: ContextVar[Optional[TestExecution]]
+_current_test = ContextVar("current_test", default=None)
+
+
+class _TestStack(LocalStack[TestExecution]):
+    """Stack of current tests.
+
+    Also keeps the topmost test in a separate context variable,
+    so reading the current test is a single lookup.
+    """
+
+    def push_without_automatic_cleanup(self, obj: TestExecution) -> None:
+        stack = self._stack.get(None)
+        if stack is None:
+            stack = []
+            self._stack.set(stack)
+        stack.append(obj)
+        _current_test.set(obj)
+
+    def pop(self) -> Optional[TestExecution]:
+        """Remove the topmost item from the stack.
+
+        Note:
+            Will return the old value or `None` if the stack was already empty.
+        """
+        stack = self._stack.get(None)
+        if not stack:
+            return None
+        item = stack.pop()
+        _current_test.set(stack[-1] if stack else None)
+        return item
+
+    @property
+    def top(self) -> Optional[TestExecution]:
+        """Return the topmost item on the stack (or :const:`None`)."""
+        return _current_test.get()
+
+
+current_test_stack: _TestStack
+current_test_stack = _TestStack()
 
 current_execution_stack: LocalStack[_TestRunner]
 current_execution_stack = LocalStack()
@@ -35,4 +75,4 @@ def current_execution() -> Optional[_TestRunner]:
 
 def current_test() -> Optional[TestExecution]:
     """Return information about the current test (if any)."""
-    return current_test_stack.top
+    return _current_test.get()
@@ -1,9 +1,9 @@
 """LiveCheck - Models."""
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
-from mode.utils.compat import want_str
+from mode.utils.compat import want_bytes, want_str
 from mode.utils.objects import cached_property
 from mode.utils.text import abbr
 
@@ -59,23 +59,18 @@ class TestExecution(Record, isodates=True):
     @classmethod
     def from_headers(cls, headers: Mapping) -> Optional["TestExecution"]:
         """Create instance from mapping of HTTP/Kafka headers."""
-        try:
-            test_id = want_str(headers[HEADER_TEST_ID])
-        except KeyError:
+        # Most events are not part of a test, so check for the
+        # test id header first instead of raising KeyError.
+        if HEADER_TEST_ID not in headers:
             return None
-        else:
-            test_name = headers[HEADER_TEST_NAME]
-            timestamp = headers[HEADER_TEST_TIMESTAMP]
-            expires = headers[HEADER_TEST_EXPIRES]
-
-            return cls(
-                id=test_id,
-                case_name=want_str(test_name),
-                timestamp=parse_iso8601(want_str(timestamp)),
-                expires=parse_iso8601(want_str(expires)),
-                test_args=(),
-                test_kwargs={},
-            )
+        return cls(
+            id=want_str(headers[HEADER_TEST_ID]),
+            case_name=want_str(headers[HEADER_TEST_NAME]),
+            timestamp=parse_iso8601(want_str(headers[HEADER_TEST_TIMESTAMP])),
+            expires=parse_iso8601(want_str(headers[HEADER_TEST_EXPIRES])),
+            test_args=(),
+            test_kwargs={},
+        )
 
     def as_headers(self) -> Mapping:
         """Return test metadata as mapping of HTTP/Kafka headers."""
@@ -86,6 +81,11 @@ class TestExecution(Record, isodates=True):
             HEADER_TEST_EXPIRES: self.expires.isoformat(),
         }
 
+    @cached_property
+    def as_header_bytes(self) -> Tuple[Tuple[str, bytes], ...]:
+        """Return test metadata as tuple of encoded Kafka headers."""
+        return tuple((k, want_bytes(v)) for k, v in self.as_headers().items())
+
     @cached_property
     def ident(self) -> str:
         """Return long identifier for this test used in logs."""
@@ -3,7 +3,16 @@ from . import aiohttp
 
 __all__ = ["aiohttp", "patch_all"]
 
+_patched = False
+
 
 def patch_all() -> None:
-    """Apply all LiveCheck monkey patches."""
+    """Apply all LiveCheck monkey patches.
+
+    Patches are only applied once, subsequent calls do nothing.
+    """
+    global _patched
+    if _patched:
+        return
+    _patched = True
     aiohttp.patch_all()
@@ -9,7 +9,12 @@ from aiohttp import web
 from faust.livecheck.locals import current_test_stack
 from faust.livecheck.models import TestExecution
 
-__all__ = ["patch_all", "patch_aiohttp_session", "LiveCheckMiddleware"]
+__all__ = [
+    "patch_all",
+    "patch_aiohttp_session",
+    "LiveCheckMiddleware",
+    "livecheck_middleware",
+]
 
 
 def patch_all() -> None:
@@ -80,3 +85,7 @@ class LiveCheckMiddleware:
             if related_test:
                 stack.enter_context(current_test_stack.push(related_test))
             return await handler(request)
+
+
+#: The middleware is stateless, so all apps share this instance.
+livecheck_middleware = LiveCheckMiddleware()
@@ -49,6 +49,10 @@ class BaseSignal(Generic[VT]):
 
     async def resolve(self, key: Any, event: SignalEvent) -> None:
         """Resolve signal with value."""
+        self.resolve_nowait(key, event)
+
+    def resolve_nowait(self, key: Any, event: SignalEvent) -> None:
+        """Resolve signal with value, without waiting."""
         self._set_current_value(key, event)
         self._wakeup_resolvers()
 
@@ -0,0 +1,11 @@
+from unittest.mock import patch
+
+from faust.livecheck import patches
+
+
+def test_patch_all():
+    with patch.object(patches, "_patched", False):
+        with patch.object(patches.aiohttp, "patch_all") as aiohttp_patch_all:
+            patches.patch_all()
+            patches.patch_all()
+            aiohttp_patch_all.assert_called_once_with()
@@ -1,16 +1,19 @@
 import asyncio
 from typing import Union
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
 import pytest
 from mode.utils.compat import want_bytes
 
+from faust.exceptions import ImproperlyConfigured
 from faust.livecheck import LiveCheck
 from faust.livecheck.app import LiveCheckSensor
 from faust.livecheck.exceptions import LiveCheckTestFailed
 from faust.livecheck.locals import current_test_stack
 from faust.livecheck.models import SignalEvent, TestExecution, TestReport
+from faust.livecheck.patches.aiohttp import livecheck_middleware
 from faust.livecheck.signals import BaseSignal
+from faust.types import AppT
 from tests.helpers import AsyncMock
 
 
@@ -27,6 +30,34 @@ class TestLiveCheckSensor:
         state = sensor.on_stream_event_in(("topic", "foo"), 3, stream, event)
         sensor.on_stream_event_out(("topic", "foo"), 3, stream, event, state)
 
+    def test_on_stream_event__no_headers(self, *, sensor):
+        stream = Mock(spec=[])
+        event = Mock()
+        event.headers = None
+        with patch("faust.livecheck.app.TestExecution") as TestExecution:
+            state = sensor.on_stream_event_in(("topic", "foo"), 3, stream, event)
+            TestExecution.from_headers.assert_not_called()
+        assert not hasattr(stream, "current_test")
+        sensor.on_stream_event_out(("topic", "foo"), 3, stream, event, state)
+        assert current_test_stack.top is None
+
+    def test_on_stream_event__buffered(self, *, sensor, execution):
+        # buffered streams (Stream.take) call on_stream_event_in for
+        # every event in the buffer before calling on_stream_event_out.
+        stream = Mock(spec=[])
+        event1 = Mock()
+        event1.headers = execution.as_headers()
+        event2 = Mock()
+        event2.headers = {}
+        tp = ("topic", "foo")
+        state1 = sensor.on_stream_event_in(tp, 3, stream, event1)
+        state2 = sensor.on_stream_event_in(tp, 4, stream, event2)
+        assert current_test_stack.top.id == execution.id
+        sensor.on_stream_event_out(tp, 3, stream, event1, state1)
+        sensor.on_stream_event_out(tp, 4, stream, event2, state2)
+        assert current_test_stack.top is None
+        assert stream.current_test is None
+
     def test_on_stream_event(self, *, sensor, execution):
         stream = Mock()
         stream.current_test = None
@@ -49,6 +80,8 @@ class Test_LiveCheck:
             ("bus_topic_name", "bus-topic", "bus-topic"),
             ("report_topic_name", "report-topic", "report-topic"),
             ("bus_concurrency", 1000, 1000),
+            ("bus_batch_size", 10, 10),
+            ("bus_batch_within", 3.0, 3.0),
             ("test_concurrency", 1001, 1001),
             ("send_reports", False, False),
         ],
@@ -57,6 +90,28 @@ class Test_LiveCheck:
         app = LiveCheck("foo", **{kwarg: value})
         assert getattr(app, kwarg) == value
 
+    @pytest.mark.parametrize("test_concurrency", [0, -1])
+    def test_constructor__invalid_test_concurrency(self, test_concurrency):
+        with pytest.raises(ImproperlyConfigured):
+            LiveCheck("foo", test_concurrency=test_concurrency)
+
+    def test_for_app(self, *, app):
+        app._default_options = (
+            "foo",
+            {"web_port": 8080, "bus_concurrency": 3, "broker": "kafka://x"},
+        )
+        app.web = Mock()
+        app.web.web_app.middlewares = []
+        livecheck = LiveCheck.for_app(app, test_concurrency=7, foo_option=1)
+        assert livecheck.conf.id == "livecheck-foo"
+        assert livecheck.conf.web_port == 9999
+        assert livecheck.bus_concurrency == 3
+        assert livecheck.test_concurrency == 7
+        assert livecheck.send_reports is True
+        assert livecheck._default_options[1]["foo_option"] == 1
+        assert app.livecheck is livecheck
+        assert app.web.web_app.middlewares == [livecheck_middleware]
+
     def test_current_test(self, *, livecheck):
         test = Mock()
         assert livecheck.current_test is None
@@ -83,6 +138,34 @@ class Test_LiveCheck:
             }
             assert headers == (original_headers + list(kafka_headers.items()))
 
+    @pytest.mark.asyncio
+    async def test_on_produce_attach_test_headers__child_task(
+        self, *, livecheck, app, execution
+    ):
+        # tasks started inside the test context keep the test,
+        # even after the parent leaves it.
+        started = asyncio.Event()
+        parent_done = asyncio.Event()
+        headers = []
+
+        async def child():
+            started.set()
+            await parent_done.wait()
+            livecheck.on_produce_attach_test_headers(
+                sender=app,
+                key=b"k",
+                value=b"v",
+                partition=3,
+                headers=headers,
+            )
+
+        with current_test_stack.push(execution):
+            task = asyncio.ensure_future(child())
+            await started.wait()
+        parent_done.set()
+        await task
+        assert headers == list(execution.as_header_bytes)
+
     def test_on_produce_attach_test_headers__no_test(self, *, livecheck, app):
         assert livecheck.current_test is None
         headers = []
@@ -129,6 +212,27 @@ class Test_LiveCheck:
         assert Test_foo.signal2.index == 2
         assert Test_foo.signal3.index == 3
 
+    def test_case_decorator__cached_signals(self, *, livecheck):
+        class Test_foo:
+            signal1: livecheck.Signal
+
+        case1 = livecheck.case(name="t.foo1")(Test_foo)
+        assert Test_foo.__livecheck_signals__ == (
+            livecheck.Case,
+            (("signal1", livecheck.Signal),),
+        )
+        with patch("faust.livecheck.app.annotations") as annotations:
+            case2 = livecheck.case(name="t.foo2")(Test_foo)
+            annotations.assert_not_called()
+        assert case1.signal1 is not case2.signal1
+        assert case2.signal1.index == 1
+
+        class Test_bar(Test_foo):
+            signal2: livecheck.Signal
+
+        case3 = livecheck.case(name="t.bar")(Test_bar)
+        assert case3.signal2.index == 2
+
     def test_add_case(self, *, livecheck):
         case = Mock()
         livecheck.add_case(case)
@@ -153,13 +257,47 @@ class Test_LiveCheck:
 
     @pytest.mark.asyncio
     async def test_on_start(self, *, livecheck):
+        livecheck._start_test_workers = Mock()
         livecheck._install_bus_agent = Mock()
         livecheck._install_test_execution_agent = Mock()
 
         await livecheck.on_start()
 
+        livecheck._start_test_workers.assert_called_once_with()
         livecheck._install_bus_agent.assert_called_once_with()
         livecheck._install_test_execution_agent.assert_called_once_with()
+        assert livecheck._bus_agent is livecheck._install_bus_agent.return_value
+        assert (
+            livecheck._test_execution_agent
+            is livecheck._install_test_execution_agent.return_value
+        )
+
+        # restarting must not install the agents again.
+        await livecheck.on_start()
+        livecheck._install_bus_agent.assert_called_once_with()
+        livecheck._install_test_execution_agent.assert_called_once_with()
+
+    def test__connect_signals(self, *, livecheck):
+        def receivers():
+            return [
+                r
+                for r in AppT.on_produce_message.iter_receivers(None)
+                if r == livecheck.on_produce_attach_test_headers
+            ]
+
+        assert len(receivers()) == 1
+        livecheck._connect_signals()
+        assert len(receivers()) == 1
+        livecheck._disconnect_signals()
+        assert not receivers()
+
+    @pytest.mark.asyncio
+    async def test_on_stop(self, *, livecheck):
+        livecheck._disconnect_signals = Mock()
+        with patch("faust.App.on_stop", AsyncMock()) as on_stop:
+            await livecheck.on_stop()
+            on_stop.assert_called_once_with()
+        livecheck._disconnect_signals.assert_called_once_with()
 
     @pytest.mark.asyncio
     async def test_on_started(self, *, livecheck):
@@ -192,9 +330,18 @@ class Test_LiveCheck:
         assert ag is livecheck.agent.return_value.return_value
         livecheck.agent.assert_called_once_with(
             channel=livecheck.pending_tests,
-            concurrency=livecheck.test_concurrency,
+            concurrency=1,
         )
 
+    def test__start_test_workers(self, *, livecheck):
+        livecheck.test_concurrency = 3
+        livecheck.add_future = Mock()
+        livecheck._test_worker = Mock()
+        livecheck._start_test_workers()
+        assert livecheck._test_queue.maxsize == 6
+        assert livecheck.add_future.call_count == 3
+        livecheck.add_future.assert_called_with(livecheck._test_worker.return_value)
+
     @pytest.mark.asyncio
     async def test__populate_signals(self, *, livecheck, execution):
         events = Mock()
@@ -211,23 +358,107 @@ class Test_LiveCheck:
             value=b"v2",
         )
         case = livecheck.cases[execution.case_name] = Mock(
+            signals={"foo": Mock()},
+            try_resolve_signal_nowait=Mock(return_value=False),
             resolve_signal=AsyncMock(),
         )
         livecheck.cases.pop("bar", None)  # make sure 'bar' is missing
 
-        async def iterate_events():
-            yield execution.id, signal
-            yield execution.id, signal2
+        async def iterate_events(max_, within):
+            assert max_ == livecheck.bus_batch_size
+            assert within == livecheck.bus_batch_within
+            yield [
+                Mock(key=execution.id, value=signal),
+                Mock(key=execution.id, value=signal2),
+            ]
+            yield [Mock(key="id2", value=signal)]
 
-        events.items.side_effect = iterate_events
+        events.take_events.side_effect = iterate_events
 
         await livecheck._populate_signals(events)
-        case.resolve_signal.assert_called_once_with(execution.id, signal)
+        case.resolve_signal.assert_has_calls(
+            [
+                call.coro(execution.id, signal),
+                call.coro("id2", signal),
+            ]
+        )
+        assert case.resolve_signal.call_count == 2
 
     @pytest.mark.asyncio
-    async def test__excecute_tests(self, *, livecheck, execution):
-        tests = Mock()
+    async def test__populate_signals__bad_events(self, *, livecheck, execution):
+        events = Mock()
+
+        def signal_event(name, case_name=execution.case_name):
+            return SignalEvent(
+                signal_name=name, case_name=case_name, key=b"k", value=b"v"
+            )
 
+        unknown = signal_event("unknown")
+        failing = signal_event("failing")
+        valid = signal_event("foo")
+        other = signal_event("foo", case_name="t.examples.test_other")
+
+        async def resolve_signal(test_id, event):
+            if event is failing:
+                raise RuntimeError("resolve failed")
+
+        case = livecheck.cases[execution.case_name] = Mock(
+            signals={"foo": Mock(), "failing": Mock()},
+            try_resolve_signal_nowait=Mock(return_value=False),
+            resolve_signal=AsyncMock(side_effect=resolve_signal),
+        )
+        other_case = livecheck.cases[other.case_name] = Mock(
+            signals={"foo": Mock()},
+            try_resolve_signal_nowait=Mock(return_value=False),
+            resolve_signal=AsyncMock(),
+        )
+        livecheck.log = Mock()
+
+        async def iterate_events(max_, within):
+            yield [
+                Mock(key="id1", value=unknown),
+                Mock(key="id2", value=failing),
+                Mock(key="id3", value=valid),
+                Mock(key="id4", value=other),
+            ]
+
+        events.take_events.side_effect = iterate_events
+
+        await livecheck._populate_signals(events)
+        case.resolve_signal.assert_has_calls(
+            [call.coro("id2", failing), call.coro("id3", valid)]
+        )
+        assert case.resolve_signal.call_count == 2
+        other_case.resolve_signal.assert_called_once_with("id4", other)
+        assert livecheck.log.error.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test__populate_signals__nowait(self, *, livecheck, execution):
+        events = Mock()
+        signal = SignalEvent(
+            signal_name="foo",
+            case_name=execution.case_name,
+            key=b"k",
+            value=b"v",
+        )
+        case = livecheck.cases[execution.case_name] = Mock(
+            signals={"foo": Mock()},
+            try_resolve_signal_nowait=Mock(return_value=True),
+            resolve_signal=AsyncMock(),
+        )
+
+        async def iterate_events(max_, within):
+            yield [Mock(key=execution.id, value=signal)]
+
+        events.take_events.side_effect = iterate_events
+
+        await livecheck._populate_signals(events)
+        case.try_resolve_signal_nowait.assert_called_once_with(execution.id, signal)
+        case.resolve_signal.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test__execute_tests(self, *, livecheck, execution):
+        tests = Mock()
         execution2 = execution.derive(case_name="bar")
 
         async def iterate_tests():
@@ -235,29 +466,68 @@ class Test_LiveCheck:
             yield execution.id, execution2
 
         tests.items.side_effect = iterate_tests
+        livecheck._test_queue = asyncio.Queue()
+
+        await livecheck._execute_tests(tests)
+        assert livecheck._test_queue.get_nowait() == (execution.id, execution)
+        assert livecheck._test_queue.get_nowait() == (execution.id, execution2)
+        assert livecheck._test_queue.empty()
 
+    @pytest.mark.asyncio
+    async def test__test_worker(self, *, livecheck, execution):
+        livecheck._test_queue = asyncio.Queue()
+        livecheck._test_queue.put_nowait((execution.id, execution))
+
+        async def on_execute(test_id, test):
+            livecheck._stopped.set()
+
+        livecheck._execute_test = AsyncMock(side_effect=on_execute)
+
+        await livecheck._test_worker()
+        livecheck._execute_test.assert_called_once_with(execution.id, execution)
+        assert livecheck._test_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test__test_worker__raises(self, *, livecheck, execution):
+        livecheck._test_queue = asyncio.Queue()
+        livecheck._test_queue.put_nowait((execution.id, execution))
+        livecheck._test_queue.put_nowait((execution.id, execution))
+        calls = 0
+
+        async def on_execute(test_id, test):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("LiveCheck app missing origin argument")
+            livecheck._stopped.set()
+
+        livecheck._execute_test = AsyncMock(side_effect=on_execute)
+        livecheck.log = Mock()
+
+        await livecheck._test_worker()
+        assert livecheck._execute_test.call_count == 2
+        livecheck.log.exception.assert_called_once()
+        assert livecheck._test_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test__execute_test(self, *, livecheck, execution):
+        execution2 = execution.derive(case_name="bar")
         case = livecheck.cases[execution.case_name] = Mock(
             execute=AsyncMock(),
         )
         livecheck.cases.pop("bar", None)  # ensure 'bar' is missing.
 
-        await livecheck._execute_tests(tests)
+        await livecheck._execute_test(execution.id, execution)
+        await livecheck._execute_test(execution.id, execution2)
         case.execute.assert_called_once_with(execution)
 
     @pytest.mark.asyncio
-    async def test__excecute_tests__raises(self, *, livecheck, execution):
-        tests = Mock()
-
-        async def iterate_tests():
-            yield execution.id, execution
-
-        tests.items.side_effect = iterate_tests
-
+    async def test__execute_test__raises(self, *, livecheck, execution):
         case = livecheck.cases[execution.case_name] = Mock(
             execute=AsyncMock(side_effect=LiveCheckTestFailed()),
         )
 
-        await livecheck._execute_tests(tests)
+        await livecheck._execute_test(execution.id, execution)
         case.execute.assert_called_once_with(execution)
 
     @pytest.mark.parametrize(
@@ -101,6 +101,30 @@ class TestCase:
         assert isinstance(case._now(), datetime)
         assert case._now().tzinfo == timezone.utc
 
+    def test_try_resolve_signal_nowait(self, *, case):
+        key = "k"
+        event = Mock(name="event")
+        signal = case.signals[event.signal_name] = case.app.Signal(name="foo")
+        signal.resolve_nowait = Mock()
+        assert case.try_resolve_signal_nowait(key, event)
+        signal.resolve_nowait.assert_called_once_with(key, event)
+
+    def test_try_resolve_signal_nowait__custom_resolve(self, *, case):
+        class CustomSignal(case.app.Signal):
+            async def resolve(self, key, event):
+                ...
+
+        event = Mock(name="event")
+        signal = case.signals[event.signal_name] = CustomSignal(name="foo")
+        signal.resolve_nowait = Mock()
+        assert not case.try_resolve_signal_nowait("k", event)
+        signal.resolve_nowait.assert_not_called()
+
+    def test_try_resolve_signal_nowait__missing(self, *, case):
+        event = Mock(name="event")
+        event.signal_name = "does-not-exist"
+        assert not case.try_resolve_signal_nowait("k", event)
+
     @pytest.mark.asyncio
     async def test_resolve_signal(self, *, case):
         key = "k"
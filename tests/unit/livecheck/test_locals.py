@@ -1,6 +1,11 @@
 from unittest.mock import Mock
 
-from faust.livecheck.locals import current_execution, current_execution_stack
+from faust.livecheck.locals import (
+    current_execution,
+    current_execution_stack,
+    current_test,
+    current_test_stack,
+)
 
 
 def test_current_execution():
@@ -17,3 +22,48 @@ def test_current_execution():
             assert current_execution() is m2
         assert current_execution() is m1
     assert current_execution() is None
+
+
+def test_current_test__nested():
+    m1 = Mock(name="m1")
+    m2 = Mock(name="m2")
+    assert current_test() is None
+    with current_test_stack.push(m1):
+        with current_test_stack.push(m2):
+            assert current_test() is m2
+            assert current_test_stack.stack == [m1, m2]
+        assert current_test() is m1
+    assert current_test() is None
+
+
+def test_current_test__without_automatic_cleanup():
+    m1 = Mock(name="m1")
+    m2 = Mock(name="m2")
+    assert current_test_stack.pop() is None
+    current_test_stack.push_without_automatic_cleanup(m1)
+    assert current_test() is m1
+    current_test_stack.push_without_automatic_cleanup(m2)
+    assert current_test_stack.top is m2
+    assert len(current_test_stack) == 2
+    assert current_test_stack.stack == [m1, m2]
+    assert current_test_stack.pop() is m2
+    assert current_test() is m1
+    assert current_test_stack.pop() is m1
+    assert current_test() is None
+    assert current_test_stack.pop() is None
+    assert not len(current_test_stack)
+    assert current_test_stack.stack == []
+
+
+def test_current_test__pop_restores_outer():
+    outer = Mock(name="outer")
+    inner = Mock(name="inner")
+    with current_test_stack.push(outer):
+        current_test_stack.push_without_automatic_cleanup(inner)
+        assert current_test() is inner
+        assert current_test_stack.stack == [outer, inner]
+        assert current_test_stack.pop() is inner
+        assert current_test() is outer
+        assert len(current_test_stack) == 1
+    assert current_test() is None
+    assert not len(current_test_stack)
@@ -1,6 +1,8 @@
 from datetime import timedelta, timezone
 
-from faust.livecheck.models import State
+from mode.utils.compat import want_bytes
+
+from faust.livecheck.models import State, TestExecution
 
 
 class TestState:
@@ -21,6 +23,24 @@ class TestTestExecution:
     def test_short_ident(self, *, execution):
         assert execution.shortident
 
+    def test_from_headers(self, *, execution):
+        headers = {k: want_bytes(v) for k, v in execution.as_headers().items()}
+        test = TestExecution.from_headers(headers)
+        assert test.id == execution.id
+        assert test.case_name == execution.case_name
+        assert test.timestamp == execution.timestamp
+        assert test.expires == execution.expires
+
+    def test_from_headers__not_a_test(self):
+        assert TestExecution.from_headers({}) is None
+        assert TestExecution.from_headers({"Foo": b"bar"}) is None
+
+    def test_as_header_bytes(self, *, execution):
+        assert execution.as_header_bytes == tuple(
+            (k, want_bytes(v)) for k, v in execution.as_headers().items()
+        )
+        assert execution.as_header_bytes is execution.as_header_bytes
+
     def test_now(self, *, execution):
         assert execution._now()
         assert execution._now().tzinfo is timezone.utc
@@ -35,6 +35,15 @@ class Test_BaseSignal:
         signal._set_current_value.assert_called_once_with("k", event)
         signal._wakeup_resolvers.assert_called_once_with()
 
+    def test_resolve_nowait(self, *, signal):
+        signal._set_current_value = Mock()
+        signal._wakeup_resolvers = Mock()
+
+        event = Mock()
+        signal.resolve_nowait("k", event)
+        signal._set_current_value.assert_called_once_with("k", event)
+        signal._wakeup_resolvers.assert_called_once_with()
+
     def test__set_name__(self, *, signal):
         signal.name = ""
         signal.__set_name__(type(signal), "foo")